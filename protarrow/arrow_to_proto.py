@@ -1,8 +1,23 @@
 import collections.abc
+import concurrent.futures
 import dataclasses
 import datetime
-from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Type
+import functools
+import itertools
+import os
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
+import numpy as np
 import pyarrow as pa
 from google.protobuf.descriptor import Descriptor, EnumDescriptor, FieldDescriptor
 from google.protobuf.internal.containers import MessageMap
@@ -25,12 +40,6 @@ from google.type.timeofday_pb2 import TimeOfDay
 from protarrow.common import M, is_binary_enum, is_string_enum, offset_values_array
 
 _NANOS_PER_UNIT = {"ns": 1, "us": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
-_TIME_CONVERTER = {
-    pa.time64("ns"): 1,
-    pa.time64("us"): 1_000,
-    pa.time32("ms"): 1_000_000,
-    pa.time32("s"): 1_000_000_00,
-}
 
 
 def _timestamp_ns_scalar_to_proto(scalar: pa.TimestampScalar) -> Timestamp:
@@ -153,59 +162,20 @@ def is_custom_field(field_descriptor: FieldDescriptor):
     )
 
 
-@dataclasses.dataclass(frozen=True)
-class OffsetsIterator:
-    offsets: pa.Array
-
-    def __iter__(self) -> Iterator[Tuple[int, int]]:
-        if len(self.offsets) > 0:
-            current_offset = self.offsets[0].as_py()
-            for item in self.offsets[1:]:
-                offset = item.as_py()
-                yield current_offset, offset
-                current_offset = offset
-
-
-@dataclasses.dataclass(frozen=True)
-class ListValuesIterator:
-    """
-    Iterate through ListArray underlying values taking offsets into consideration.
-    """
-
-    list_array: pa.ListArray
-
-    def __iter__(self) -> Iterator[pa.Scalar]:
-        values_array = self.list_array.values
-        for first, last in OffsetsIterator(self.list_array.offsets):
-            for value in values_array[first:last]:
-                yield value
-
-
-@dataclasses.dataclass(frozen=True)
-class OffsetToSize(collections.abc.Iterable):
-    array: pa.Array
-
-    def __post_init__(self):
-        assert pa.types.is_integer(self.array.type)
-
-    def __iter__(self) -> Iterator[int]:
-        if len(self.array) > 0:
-            current_offset = self.array[0].as_py()
-            for item in self.array[1:]:
-                offset = item.as_py()
-                yield offset - current_offset
-                current_offset = offset
+def _offsets_to_sizes(offsets: pa.Array) -> np.ndarray:
+    """Compute the size of each list/map entry from the offsets in one vector op"""
+    return np.diff(offsets.to_numpy(zero_copy_only=False))
 
 
 @dataclasses.dataclass(frozen=True)
 class OptionalNestedIterable(collections.abc.Iterable):
     parents: Iterable[Message]
     field_descriptor: FieldDescriptor
-    validity_mask: Iterable[pa.BooleanScalar]
+    validity_mask: Iterable[bool]
 
     def __iter__(self) -> Iterator[Optional[Any]]:
         for parent, valid in zip(self.parents, self.validity_mask):
-            if valid.is_valid and valid.as_py() and parent is not None:
+            if valid and parent is not None:
                 yield getattr(parent, self.field_descriptor.name)
             else:
                 yield None
@@ -214,7 +184,7 @@ class OptionalNestedIterable(collections.abc.Iterable):
         """This needs to be called if there are no fields in the message"""
         empty = self.field_descriptor.message_type._concrete_class()
         for parent, valid in zip(self.parents, self.validity_mask):
-            if valid.is_valid and valid.as_py() and parent is not None:
+            if valid and parent is not None:
                 value = getattr(parent, self.field_descriptor.name)
                 value.MergeFrom(empty)
 
@@ -239,6 +209,21 @@ def convert_scalar(scalar: pa.Scalar) -> Any:
     return scalar.as_py()
 
 
+def _enum_names_to_numbers(
+    values: List[Any], enum_descriptor: EnumDescriptor, arrow_type: pa.DataType
+) -> List[Optional[int]]:
+    if pa.types.is_integer(arrow_type):
+        return values
+    elif is_binary_enum(arrow_type):
+        mapping = {v.name.encode("utf-8"): v.number for v in enum_descriptor.values}
+    elif is_string_enum(arrow_type):
+        mapping = {v.name: v.number for v in enum_descriptor.values}
+    else:
+        raise TypeError(arrow_type)
+    return [mapping.get(value, 0) if value is not None else None for value in values]
+
+
+@functools.lru_cache(maxsize=None)
 def create_enum_converter(
     enum_descriptor: EnumDescriptor, arrow_type: pa.DataType
 ) -> Callable[[pa.Scalar], int]:
@@ -254,6 +239,7 @@ def create_enum_converter(
         raise TypeError(arrow_type)
 
 
+@functools.lru_cache(maxsize=None)
 def get_converter(
     field_descriptor: FieldDescriptor, arrow_type: pa.DataType
 ) -> Callable[[pa.Scalar], Any]:
@@ -266,94 +252,6 @@ def get_converter(
         return convert_scalar
 
 
-class PlainAssigner(collections.abc.Iterable):
-    def __init__(
-        self,
-        messages: Iterable[Message],
-        field_descriptor: FieldDescriptor,
-        arrow_type: pa.DataType,
-    ):
-        self.messages = messages
-        self.field_descriptor = field_descriptor
-        self.converter = get_converter(field_descriptor, arrow_type)
-        self.nullable = self.field_descriptor.message_type in NULLABLE_TYPES
-        self.message = None
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar], None]]:
-        assert self.message is None
-        for message in self.messages:
-            self.message = message
-            yield self
-        self.message = None
-
-    def __call__(self, scalar: pa.Scalar) -> None:
-        value = self.converter(scalar) if scalar.is_valid else None
-        # `self.message` can be null for nested messages.
-        # We'd expect the scalar to be either null or the default value in this case
-        if self.message is not None and value is not None:
-            if self.nullable:
-                getattr(self.message, self.field_descriptor.name).value = value
-            else:
-                setattr(self.message, self.field_descriptor.name, value)
-
-
-class AppendAssigner(collections.abc.Iterable):
-    def __init__(
-        self,
-        messages: Iterable[Message],
-        field_descriptor: FieldDescriptor,
-        sizes: Iterable[int],
-        converter: Callable[[Any], Any],
-    ):
-        self.messages = messages
-        self.field_descriptor = field_descriptor
-        assert self.field_descriptor.label == FieldDescriptor.LABEL_REPEATED
-        self.sizes = sizes
-        self.converter = converter
-        self.attribute = None
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar], None]]:
-        assert self.attribute is None
-        for message, size in zip(self.messages, self.sizes):
-            if message is not None:
-                self.attribute = getattr(message, self.field_descriptor.name)
-                for _ in range(size):
-                    yield self
-        self.attribute = None
-
-    def __call__(self, scalar: pa.Scalar) -> None:
-        self.attribute.append(self.converter(scalar))
-
-
-@dataclasses.dataclass
-class MapKeyAssigner(collections.abc.Iterable):
-    messages: Iterable[Message]
-    field_descriptor: FieldDescriptor
-    key_arrow_type: dataclasses.InitVar[pa.DataType]
-    sizes: Iterable[int]
-    converter: Callable[[pa.Scalar], Any] = dataclasses.field(init=False)
-    attribute: Any = None
-
-    def __post_init__(self, key_arrow_type: pa.DataType):
-        assert self.field_descriptor.label == FieldDescriptor.LABEL_REPEATED
-        assert self.field_descriptor.message_type.GetOptions().map_entry
-        self.converter = get_converter(
-            self.field_descriptor.message_type.fields_by_name["key"], key_arrow_type
-        )
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar], Message]]:
-        assert self.attribute is None
-        for message, offset in zip(self.messages, self.sizes):
-            if message is not None:
-                self.attribute = getattr(message, self.field_descriptor.name)
-                for _ in range(offset):
-                    yield self
-        self.attribute = None
-
-    def __call__(self, scalar: pa.Scalar) -> Message:
-        return self.attribute[self.converter(scalar)]
-
-
 def _direct_assign_map(attribute: MessageMap, key: Any, value: Any):
     attribute[key] = value
 
@@ -365,57 +263,14 @@ def _merge_assign_map(attribute: MessageMap, key: Any, value: Any):
         attribute[key].MergeFrom(value)
 
 
-@dataclasses.dataclass
-class MapItemAssigner(collections.abc.Iterable):
-    messages: Iterable[Message]
-    field_descriptor: FieldDescriptor
-    key_arrow_type: dataclasses.InitVar[pa.DataType]
-    value_arrow_type: dataclasses.InitVar[pa.DataType]
-    sizes: Iterable[int]
-    key_converter: Callable[[pa.Scalar], Any] = dataclasses.field(init=False)
-    value_converter: Callable[[pa.Scalar], Any] = dataclasses.field(init=False)
-    assigner: Callable[[MessageMap, Any, Any], None] = dataclasses.field(init=False)
-    attribute: Optional[MessageMap] = None
-
-    def __post_init__(self, key_arrow_type: pa.DataType, value_arrow_type: pa.DataType):
-        assert self.field_descriptor.label == FieldDescriptor.LABEL_REPEATED
-        assert self.field_descriptor.message_type.GetOptions().map_entry
-        self.key_converter = get_converter(
-            self.field_descriptor.message_type.fields_by_name["key"], key_arrow_type
-        )
-        value_descriptor = self.field_descriptor.message_type.fields_by_name["value"]
-        self.value_converter = WrappedValueConverterAdapter.maybe_wrap(
-            get_converter(value_descriptor, value_arrow_type), value_descriptor
-        )
-        self.assigner = (
-            _merge_assign_map
-            if (value_descriptor.type == FieldDescriptor.TYPE_MESSAGE)
-            else _direct_assign_map
-        )
-
-    def __iter__(self) -> Iterator[Callable[[pa.Scalar, pa.Scalar], Message]]:
-        assert self.attribute is None
-        for message, size in zip(self.messages, self.sizes):
-            if message is not None:
-                self.attribute = getattr(message, self.field_descriptor.name)
-                for _ in range(size):
-                    yield self
-        self.attribute = None
-
-    def __call__(self, key: pa.Scalar, value: pa.Scalar):
-        self.assigner(
-            self.attribute,
-            self.key_converter(key),
-            self.value_converter(value) if value.is_valid else None,
-        )
-
-
 def _extract_struct_field(
     array: pa.StructArray,
     field_descriptor: FieldDescriptor,
     messages: Iterable[Message],
 ) -> None:
-    nested_list = OptionalNestedIterable(messages, field_descriptor, array.is_valid())
+    nested_list = OptionalNestedIterable(
+        messages, field_descriptor, array.is_valid().to_numpy(zero_copy_only=False)
+    )
     nested_list.prime()
     _extract_array_messages(array, field_descriptor.message_type, nested_list)
 
@@ -435,43 +290,54 @@ def _extract_map_field(
         # Because protobuf doesn't warranty orders of map,
         # we have to make a copy of the list of values here
         values = []
-        for assigner, key in zip(
-            MapKeyAssigner(
-                messages,
-                field_descriptor,
-                array.type.key_type,
-                OffsetToSize(array.offsets),
-            ),
-            keys_array,
-        ):
-            values.append(assigner(key))
+        key_converter = get_converter(
+            field_descriptor.message_type.fields_by_name["key"], array.type.key_type
+        )
+        field_name = field_descriptor.name
+        keys_iterator = iter(keys_array)
+        for message, size in zip(messages, _offsets_to_sizes(array.offsets)):
+            if message is not None:
+                attribute = getattr(message, field_name)
+                for _ in range(size):
+                    values.append(attribute[key_converter(next(keys_iterator))])
 
         assert pa.types.is_struct(array.type.item_type), array.type
         item_type: pa.StructType = array.type.item_type
         assert isinstance(item_type, pa.StructType)
 
-        for field_descriptor in value_descriptor.message_type.fields:
-            field_index = item_type.get_field_index(field_descriptor.name)
-            if field_index != -1:
-                _extract_field(
-                    values_array.field(field_index),
-                    field_descriptor,
-                    values,
-                )
+        for field_index, field_descriptor in _struct_extraction_plan(
+            value_descriptor.message_type, item_type
+        ):
+            _extract_field(
+                values_array.field(field_index),
+                field_descriptor,
+                values,
+            )
 
     else:
-        for assigner, key, value in zip(
-            MapItemAssigner(
-                messages,
-                field_descriptor,
-                array.type.key_type,
-                array.type.item_type,
-                OffsetToSize(array.offsets),
-            ),
-            keys_array,
-            values_array,
-        ):
-            assigner(key, value)
+        key_converter = get_converter(
+            field_descriptor.message_type.fields_by_name["key"], array.type.key_type
+        )
+        value_converter = WrappedValueConverterAdapter.maybe_wrap(
+            get_converter(value_descriptor, array.type.item_type), value_descriptor
+        )
+        assign = (
+            _merge_assign_map
+            if (value_descriptor.type == FieldDescriptor.TYPE_MESSAGE)
+            else _direct_assign_map
+        )
+        field_name = field_descriptor.name
+        items_iterator = zip(keys_array, values_array)
+        for message, size in zip(messages, _offsets_to_sizes(array.offsets)):
+            if message is not None:
+                attribute = getattr(message, field_name)
+                for _ in range(size):
+                    key, value = next(items_iterator)
+                    assign(
+                        attribute,
+                        key_converter(key),
+                        value_converter(value) if value.is_valid else None,
+                    )
 
 
 def _extract_repeated_field(
@@ -508,36 +374,51 @@ class WrappedValueConverterAdapter:
             return converter
 
 
+def _flat_field_values(
+    values_array: pa.Array, field_descriptor: FieldDescriptor
+) -> Sequence[Any]:
+    """Convert a flattened list-values array to proto values in a single pass"""
+    if field_descriptor.type == FieldDescriptor.TYPE_ENUM:
+        return _enum_names_to_numbers(
+            values_array.to_pylist(), field_descriptor.enum_type, values_array.type
+        )
+    elif field_descriptor.type == FieldDescriptor.TYPE_MESSAGE:
+        converter = WrappedValueConverterAdapter.maybe_wrap(
+            get_converter(field_descriptor, values_array.type), field_descriptor
+        )
+        return [converter(scalar) for scalar in values_array]
+    elif values_array.null_count == 0 and (
+        pa.types.is_integer(values_array.type)
+        or pa.types.is_floating(values_array.type)
+    ):
+        # One vectorized conversion instead of boxing one pa.Scalar per
+        # element; protobuf still iterates the numpy array when extending
+        return values_array.to_numpy(zero_copy_only=False)
+    else:
+        return values_array.to_pylist()
+
+
 def _extract_repeated_primitive(
     array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
 ) -> None:
-    converter = WrappedValueConverterAdapter.maybe_wrap(
-        get_converter(field_descriptor, array.type.value_type), field_descriptor
-    )
-    assigner = AppendAssigner(
-        messages=messages,
-        field_descriptor=field_descriptor,
-        sizes=OffsetToSize(array.offsets),
-        converter=converter,
-    )
-
-    for each_assigner, value in zip(assigner, ListValuesIterator(array)):
-        each_assigner(value)
+    offsets = array.offsets.to_numpy(zero_copy_only=False)
+    flat_values = _flat_field_values(array.values, field_descriptor)
+    field_name = field_descriptor.name
+    for message, start, end in zip(messages, offsets, offsets[1:]):
+        if message is not None and end > start:
+            getattr(message, field_name).extend(flat_values[start:end])
 
 
 def _extract_repeated_message(
     array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
 ):
     assert pa.types.is_list(array.type) or pa.types.is_large_list(array.type)
-    child = field_descriptor.message_type._concrete_class()
-    assigner = AppendAssigner(
-        messages,
-        field_descriptor,
-        OffsetToSize(array.offsets),
-        lambda x: x,
-    )
-    for each_assigner, value in zip(assigner, ListValuesIterator(array)):
-        each_assigner(child)
+    field_name = field_descriptor.name
+    for message, size in zip(messages, _offsets_to_sizes(array.offsets)):
+        if message is not None and size > 0:
+            add = getattr(message, field_name).add
+            for _ in range(size):
+                add()
     _extract_array_messages(
         offset_values_array(array, array.values),
         field_descriptor.message_type,
@@ -545,15 +426,80 @@ def _extract_repeated_message(
     )
 
 
+def _extract_timestamp_field(
+    array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
+) -> None:
+    """
+    Assign a whole timestamp column at once, splitting the epoch values into
+    seconds/nanos with vectorized numpy arithmetic instead of building one
+    intermediate Timestamp per scalar.
+    """
+    ints = array.view(pa.int64())
+    if array.null_count:
+        ints = ints.fill_null(0)
+    values = ints.to_numpy(zero_copy_only=False)
+    units_per_second = 1_000_000_000 // _NANOS_PER_UNIT[array.type.unit]
+    all_seconds = values // units_per_second
+    all_nanos = (values - all_seconds * units_per_second) * _NANOS_PER_UNIT[
+        array.type.unit
+    ]
+    validity = array.is_valid().to_numpy(zero_copy_only=False)
+    field_name = field_descriptor.name
+    for message, valid, seconds, nanos in zip(
+        messages, validity, all_seconds, all_nanos
+    ):
+        if valid and message is not None:
+            timestamp = getattr(message, field_name)
+            timestamp.seconds = seconds
+            timestamp.nanos = nanos
+
+
+def _extract_time_of_day_field(
+    array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
+) -> None:
+    """
+    Assign a whole time of day column at once, reinterpreting the storage as
+    integers and splitting them into components with vectorized numpy
+    arithmetic instead of building one intermediate TimeOfDay per scalar.
+    """
+    ints = array.view(pa.int64() if pa.types.is_time64(array.type) else pa.int32())
+    if array.null_count:
+        ints = ints.fill_null(0)
+    values = ints.to_numpy(zero_copy_only=False).astype(np.int64, copy=False)
+    nanos_per_unit = _NANOS_PER_UNIT[array.type.unit]
+    if nanos_per_unit != 1:
+        values = values * nanos_per_unit
+    all_nanos = values % 1_000_000_000
+    all_seconds = values // 1_000_000_000 % 60
+    all_minutes = values // 60_000_000_000 % 60
+    all_hours = values // 3_600_000_000_000
+    validity = array.is_valid().to_numpy(zero_copy_only=False)
+    field_name = field_descriptor.name
+    for message, valid, hours, minutes, seconds, nanos in zip(
+        messages, validity, all_hours, all_minutes, all_seconds, all_nanos
+    ):
+        if valid and message is not None:
+            time_of_day = getattr(message, field_name)
+            time_of_day.hours = hours
+            time_of_day.minutes = minutes
+            time_of_day.seconds = seconds
+            time_of_day.nanos = nanos
+
+
 def _extract_field(
     array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
 ) -> None:
     if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
         _extract_repeated_field(array, field_descriptor, messages)
+    elif field_descriptor.message_type == Timestamp.DESCRIPTOR:
+        _extract_timestamp_field(array, field_descriptor, messages)
+    elif field_descriptor.message_type == TimeOfDay.DESCRIPTOR:
+        _extract_time_of_day_field(array, field_descriptor, messages)
     elif field_descriptor.message_type in TEMPORAL_CONVERTERS:
         extractor = TEMPORAL_CONVERTERS[field_descriptor.message_type](array.type)
-        for message, value in zip(messages, array):
-            if value.is_valid and message is not None:
+        validity = array.is_valid().to_numpy(zero_copy_only=False)
+        for message, valid, value in zip(messages, validity, array):
+            if valid and message is not None:
                 getattr(
                     message,
                     field_descriptor.name,
@@ -564,10 +510,62 @@ def _extract_field(
     ):
         _extract_struct_field(array, field_descriptor, messages)
     else:
-        plain_assigner = PlainAssigner(messages, field_descriptor, array.type)
-        for plain_assigner, value in zip(plain_assigner, array):
-            if value.is_valid:
-                plain_assigner(value)
+        _extract_plain_field(array, field_descriptor, messages)
+
+
+def _extract_plain_field(
+    array: pa.Array, field_descriptor: FieldDescriptor, messages: Iterable[Message]
+) -> None:
+    """
+    Assign plain (non-repeated, non-struct) values in bulk, materializing the
+    whole array once with `to_pylist` instead of boxing one `pa.Scalar` per row.
+    """
+    values = array.to_pylist()
+    if field_descriptor.type == FieldDescriptor.TYPE_ENUM:
+        values = _enum_names_to_numbers(values, field_descriptor.enum_type, array.type)
+    field_name = field_descriptor.name
+    if field_descriptor.message_type in NULLABLE_TYPES:
+        for message, value in zip(messages, values):
+            if message is not None and value is not None:
+                getattr(message, field_name).value = value
+    else:
+        for message, value in zip(messages, values):
+            if message is not None and value is not None:
+                setattr(message, field_name, value)
+
+
+@functools.lru_cache(maxsize=None)
+def _struct_extraction_plan(
+    message_descriptor: Descriptor, struct_type: pa.StructType
+) -> List[Tuple[int, FieldDescriptor]]:
+    """
+    Resolve which struct field feeds which message field once per
+    `(message_descriptor, struct_type)` pair, saving the name lookups
+    when the same struct is extracted batch after batch.
+    """
+    plan = []
+    for field_descriptor in message_descriptor.fields:
+        index = struct_type.get_field_index(field_descriptor.name)
+        if index != -1:
+            plan.append((index, field_descriptor))
+    return plan
+
+
+@functools.lru_cache(maxsize=None)
+def _extraction_plan(
+    message_descriptor: Descriptor, schema: pa.Schema
+) -> List[Tuple[int, FieldDescriptor]]:
+    """
+    Resolve which schema column feeds which field once per
+    `(message_descriptor, schema)` pair, so repeated batch extraction skips
+    the per-call name lookups.
+    """
+    plan = []
+    for field_descriptor in message_descriptor.fields:
+        index = schema.get_field_index(field_descriptor.name)
+        if index != -1:
+            plan.append((index, field_descriptor))
+    return plan
 
 
 def _extract_record_batch_messages(
@@ -575,11 +573,10 @@ def _extract_record_batch_messages(
     message_descriptor: Descriptor,
     messages: Iterable[Message],
 ) -> None:
-    for field_descriptor in message_descriptor.fields:
-        if field_descriptor.name in record_batch.schema.names:
-            _extract_field(
-                record_batch[field_descriptor.name], field_descriptor, messages
-            )
+    for index, field_descriptor in _extraction_plan(
+        message_descriptor, record_batch.schema
+    ):
+        _extract_field(record_batch.column(index), field_descriptor, messages)
 
 
 def _extract_array_messages(
@@ -589,23 +586,47 @@ def _extract_array_messages(
 ) -> None:
     assert pa.types.is_struct(array.type), array.type
     assert isinstance(array, pa.StructArray)
-    struct_type: pa.StructType = array.type
-    for field_descriptor in message_descriptor.fields:
-        index = struct_type.get_field_index(field_descriptor.name)
-        if index != -1:
-            _extract_field(array.field(index), field_descriptor, messages)
+    for index, field_descriptor in _struct_extraction_plan(
+        message_descriptor, array.type
+    ):
+        _extract_field(array.field(index), field_descriptor, messages)
 
 
 def record_batch_to_messages(
     record_batch: pa.RecordBatch, message_type: Type[M]
 ) -> List[M]:
-    messages = [message_type() for _ in range(record_batch.num_rows)]
+    messages = [message_type() for _ in itertools.repeat(None, record_batch.num_rows)]
     _extract_record_batch_messages(record_batch, message_type.DESCRIPTOR, messages)
     return messages
 
 
-def table_to_messages(table: pa.Table, message_type: Type[M]) -> List[M]:
-    messages = []
-    for batch in table.to_reader():
-        messages.extend(record_batch_to_messages(batch, message_type))
+def table_to_messages(
+    table: pa.Table, message_type: Type[M], parallel: Optional[bool] = None
+) -> List[M]:
+    """
+    Convert a `pa.Table` to a list of protobuf messages.
+
+    Batches are converted concurrently on a thread pool when `parallel`
+    is True, or by default when the table has more than one batch.
+    """
+    batches = table.to_batches()
+    if parallel is None:
+        parallel = len(batches) > 1
+    if parallel and len(batches) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda batch: record_batch_to_messages(batch, message_type),
+                    batches,
+                )
+            )
+    else:
+        results = [record_batch_to_messages(batch, message_type) for batch in batches]
+    messages: List[M] = [None] * table.num_rows
+    offset = 0
+    for batch_messages in results:
+        messages[offset : offset + len(batch_messages)] = batch_messages
+        offset += len(batch_messages)
     return messages
@@ -1,6 +1,7 @@
 import collections.abc
 import dataclasses
 import datetime
+import functools
 import operator
 from typing import (
     Any,
@@ -15,6 +16,7 @@ from typing import (
     Union,
 )
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 from google.protobuf.descriptor import Descriptor, EnumDescriptor, FieldDescriptor
@@ -51,6 +53,20 @@ _PROTO_DESCRIPTOR_TO_PYARROW = {
     UInt64Value.DESCRIPTOR: pa.uint64(),
 }
 
+_WRAPPER_DESCRIPTORS = frozenset(
+    [
+        BoolValue.DESCRIPTOR,
+        BytesValue.DESCRIPTOR,
+        DoubleValue.DESCRIPTOR,
+        FloatValue.DESCRIPTOR,
+        Int32Value.DESCRIPTOR,
+        Int64Value.DESCRIPTOR,
+        StringValue.DESCRIPTOR,
+        UInt32Value.DESCRIPTOR,
+        UInt64Value.DESCRIPTOR,
+    ]
+)
+
 _PROTO_PRIMITIVE_TYPE_TO_PYARROW = {
     FieldDescriptorProto.TYPE_DOUBLE: pa.float64(),
     FieldDescriptorProto.TYPE_FLOAT: pa.float32(),
@@ -70,38 +86,7 @@ _PROTO_PRIMITIVE_TYPE_TO_PYARROW = {
 }
 
 
-def _time_of_day_to_nanos(time_of_day: TimeOfDay) -> int:
-    return (
-        (time_of_day.hours * 60 + time_of_day.minutes) * 60 + time_of_day.seconds
-    ) * 1_000_000_000 + time_of_day.nanos
-
-
-def _time_of_day_to_micros(time_of_day: TimeOfDay) -> int:
-    return (
-        (time_of_day.hours * 60 + time_of_day.minutes) * 60 + time_of_day.seconds
-    ) * 1_000_000 + time_of_day.nanos // 1_000
-
-
-def _time_of_day_to_millis(time_of_day: TimeOfDay) -> int:
-    return (
-        (time_of_day.hours * 60 + time_of_day.minutes) * 60 + time_of_day.seconds
-    ) * 1_000 + time_of_day.nanos // 1_000_000
-
-
-def _time_of_day_to_seconds(time_of_day: TimeOfDay) -> int:
-    return (time_of_day.hours * 60 + time_of_day.minutes) * 60 + time_of_day.seconds
-
-
-def _proto_date_to_py_date(proto_date: Date) -> datetime.date:
-    if proto_date.year == 0:
-        return datetime.date.min
-    else:
-        return datetime.date(proto_date.year, proto_date.month, proto_date.day)
-
-
 _PROTO_DESCRIPTOR_TO_ARROW_CONVERTER = {
-    Date.DESCRIPTOR: _proto_date_to_py_date,
-    TimeOfDay.DESCRIPTOR: _time_of_day_to_nanos,
     BoolValue.DESCRIPTOR: operator.attrgetter("value"),
     BytesValue.DESCRIPTOR: operator.attrgetter("value"),
     DoubleValue.DESCRIPTOR: operator.attrgetter("value"),
@@ -120,13 +105,18 @@ _TIMESTAMP_CONVERTERS = {
     "ns": Timestamp.ToNanoseconds,
 }
 
-_TIME_OF_DAY_CONVERTERS = {
-    "s": _time_of_day_to_seconds,
-    "ms": _time_of_day_to_millis,
-    "us": _time_of_day_to_micros,
-    "ns": _time_of_day_to_nanos,
+_TIME_OF_DAY_UNIT_DIVISORS = {
+    "s": 1_000_000_000,
+    "ms": 1_000_000,
+    "us": 1_000,
+    "ns": 1,
 }
 
+_EMPTY_TIME_OF_DAY = TimeOfDay()
+_EMPTY_DATE = Date()
+# `google.type.Date` with a year of zero maps to `datetime.date.min`
+_DATE_MIN_DAYS = datetime.date.min.toordinal() - datetime.date(1970, 1, 1).toordinal()
+
 
 @dataclasses.dataclass(frozen=True)
 class FlattenedIterable(collections.abc.Iterable):
@@ -158,42 +148,6 @@ class NestedIterable(collections.abc.Iterable):
         return len(self.parents)
 
 
-@dataclasses.dataclass(frozen=True)
-class NestedMessageGetter:
-    name: str
-
-    def __call__(self, message: Message) -> Optional[Message]:
-        if message.HasField(self.name):
-            return getattr(message, self.name)
-        else:
-            return None
-
-
-@dataclasses.dataclass(frozen=True)
-class MapKeyIterable(collections.abc.Iterable):
-    scalar_map: Iterable[Optional[MessageMap]]
-
-    def __iter__(self) -> Iterator[Any]:
-        for scalar_map in self.scalar_map:
-            if scalar_map is not None:
-                for key in scalar_map.keys():
-                    yield key
-
-
-@dataclasses.dataclass(frozen=True)
-class MapValueIterable(collections.abc.Iterable):
-    scalar_map: Iterable[Optional[MessageMap]]
-
-    def __iter__(self) -> Iterator[Any]:
-        for scalar_map in self.scalar_map:
-            if scalar_map is not None:
-                for value in scalar_map.values():
-                    yield value
-
-    def __len__(self) -> int:
-        return sum(len(i) for i in self.scalar_map if i)
-
-
 def is_map(field_descriptor: FieldDescriptor) -> bool:
     return (
         field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
@@ -215,7 +169,7 @@ def get_enum_converter(
     data_type: pa.DataType, enum_descriptor: EnumDescriptor
 ) -> Callable[[int], Any]:
     if pa.types.is_integer(data_type):
-        return lambda x: x
+        return _identity
 
     elif is_binary_enum(data_type):
         values_by_number = {
@@ -308,14 +262,16 @@ def field_descriptor_to_data_type(
         )
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
 def _get_converter(
     field_descriptor: FieldDescriptor,
     config: ProtarrowConfig,
 ) -> Optional[Callable[[Any], Any]]:
     if field_descriptor.message_type == Timestamp.DESCRIPTOR:
         return _TIMESTAMP_CONVERTERS[config.timestamp_type.unit]
-    elif field_descriptor.message_type == TimeOfDay.DESCRIPTOR:
-        return _TIME_OF_DAY_CONVERTERS[config.time_of_day_type.unit]
     elif field_descriptor.type == FieldDescriptorProto.TYPE_MESSAGE:
         # This may return None, in which case you need to convert
         # each underlying field to array and put them back together
@@ -324,7 +280,7 @@ def _get_converter(
     elif field_descriptor.type == FieldDescriptorProto.TYPE_ENUM:
         return get_enum_converter(config.enum_type, field_descriptor.enum_type)
     elif field_descriptor.type in _PROTO_PRIMITIVE_TYPE_TO_PYARROW:
-        return lambda x: x
+        return _identity
     else:
         raise TypeError(
             f"Unsupported field type "
@@ -333,12 +289,219 @@ def _get_converter(
         )
 
 
+_PYARROW_TO_NUMPY_DTYPE = {
+    pa.bool_(): np.dtype(np.bool_),
+    pa.int32(): np.dtype(np.int32),
+    pa.int64(): np.dtype(np.int64),
+    pa.uint32(): np.dtype(np.uint32),
+    pa.uint64(): np.dtype(np.uint64),
+    pa.float32(): np.dtype(np.float32),
+    pa.float64(): np.dtype(np.float64),
+}
+
+
+def _numpy_dtype(data_type: pa.DataType) -> Optional[np.dtype]:
+    """
+    Return the numpy dtype backing a fixed width arrow type,
+    or None if the type cannot be filled through a numpy buffer.
+    """
+    if pa.types.is_timestamp(data_type) or pa.types.is_time64(data_type):
+        return np.dtype(np.int64)
+    elif pa.types.is_time32(data_type):
+        return np.dtype(np.int32)
+    else:
+        return _PYARROW_TO_NUMPY_DTYPE.get(data_type)
+
+
+def _proto_field_to_numpy_array(
+    proto_field_values: Iterable[Any],
+    converter: Callable[[Any], Any],
+    null_value: Optional[Any],
+    dtype: np.dtype,
+    data_type: pa.DataType,
+    validity_mask: Optional[Sequence[bool]],
+) -> pa.Array:
+    count = len(proto_field_values)
+    if converter is _identity and validity_mask is None:
+        # The whole loop can run in C through np.fromiter: there is no value
+        # conversion and no per-record validity to track.
+        if null_value is None:
+            buffer = np.fromiter(proto_field_values, dtype, count=count)
+        else:
+            buffer = np.fromiter(
+                (
+                    null_value if record is None else record
+                    for record in proto_field_values
+                ),
+                dtype,
+                count=count,
+            )
+        return pa.array(buffer, data_type)
+    buffer = np.zeros(count, dtype=dtype)
+    null_mask = np.zeros(count, dtype=bool)
+    for i, record in enumerate(proto_field_values):
+        if record is None or not (validity_mask is None or validity_mask[i]):
+            if null_value is None:
+                null_mask[i] = True
+            else:
+                buffer[i] = null_value
+        else:
+            buffer[i] = converter(record)
+    return pa.array(buffer, data_type, mask=null_mask)
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_lookup(
+    enum_descriptor: EnumDescriptor, data_type: pa.DataType
+) -> Tuple[np.ndarray, pa.Array, int]:
+    """
+    Precompute, once per enum and arrow type, the sorted enum numbers, their
+    names as an arrow array and the index of the fallback name used for
+    unknown numbers.
+    """
+    numbers = sorted(enum_descriptor.values_by_number)
+    if is_binary_enum(data_type):
+        names = pa.array(
+            [
+                bytes(enum_descriptor.values_by_number[number].name, encoding="UTF-8")
+                for number in numbers
+            ],
+            pa.binary(),
+        )
+    else:
+        names = pa.array(
+            [enum_descriptor.values_by_number[number].name for number in numbers],
+            pa.string(),
+        )
+    fallback_index = numbers.index(enum_descriptor.values[0].number)
+    return np.asarray(numbers, dtype=np.int64), names, fallback_index
+
+
+def _enum_field_to_array(
+    proto_field_values: Iterable[Optional[int]],
+    enum_descriptor: EnumDescriptor,
+    null_number: Optional[int],
+    data_type: pa.DataType,
+    validity_mask: Optional[Sequence[bool]],
+) -> pa.Array:
+    """
+    Convert a column of enum numbers to their names through a dictionary
+    array, replacing one Python dict probe per record with a numpy gather.
+    """
+    records = list(proto_field_values)
+    count = len(records)
+    null_mask = np.zeros(count, dtype=bool)
+    for i, record in enumerate(records):
+        if record is None or not (validity_mask is None or validity_mask[i]):
+            records[i] = 0 if null_number is None else null_number
+            null_mask[i] = null_number is None
+    numbers, names, fallback_index = _enum_lookup(enum_descriptor, data_type)
+    raw = np.fromiter(records, np.int64, count=count)
+    indices = np.searchsorted(numbers, raw)
+    indices[indices >= len(numbers)] = fallback_index
+    indices[numbers[indices] != raw] = fallback_index
+    # `take` keeps dictionary encoding in first occurrence order, consistent
+    # with building the array from python strings
+    array = names.take(pa.array(indices.astype(np.int32, copy=False), mask=null_mask))
+    if array.type != data_type:
+        return array.cast(data_type)
+    else:
+        return array
+
+
+def _date_to_numpy_array(
+    proto_field_values: Iterable[Optional[Date]],
+    null_value: Optional[datetime.date],
+    validity_mask: Optional[Sequence[bool]],
+) -> pa.Array:
+    """
+    Convert a column of Date messages straight to days since epoch with
+    vectorized numpy arithmetic (the days-from-civil algorithm), instead of
+    building one `datetime.date` per record.
+    """
+    records = list(proto_field_values)
+    count = len(records)
+    null_mask = np.zeros(count, dtype=bool)
+    for i, record in enumerate(records):
+        if record is None or not (validity_mask is None or validity_mask[i]):
+            records[i] = _EMPTY_DATE
+            null_mask[i] = null_value is None
+    years = np.fromiter((record.year for record in records), np.int64, count=count)
+    months = np.fromiter((record.month for record in records), np.int64, count=count)
+    days = np.fromiter((record.day for record in records), np.int64, count=count)
+    shifted_years = years - (months <= 2)
+    era = shifted_years // 400
+    year_of_era = shifted_years - era * 400
+    shifted_months = months + np.where(months > 2, -3, 9)
+    day_of_year = (153 * shifted_months + 2) // 5 + days - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    epoch_days = era * 146097 + day_of_era - 719468
+    epoch_days[years == 0] = _DATE_MIN_DAYS
+    return pa.array(epoch_days.astype(np.int32), pa.date32(), mask=null_mask)
+
+
+def _time_of_day_to_numpy_array(
+    proto_field_values: Iterable[Optional[TimeOfDay]],
+    null_value: Optional[int],
+    dtype: np.dtype,
+    data_type: pa.DataType,
+    validity_mask: Optional[Sequence[bool]],
+) -> pa.Array:
+    """
+    Convert a column of TimeOfDay messages with vectorized numpy arithmetic
+    instead of one Python converter call per record.
+    """
+    records = list(proto_field_values)
+    count = len(records)
+    null_mask = np.zeros(count, dtype=bool)
+    for i, record in enumerate(records):
+        if record is None or not (validity_mask is None or validity_mask[i]):
+            records[i] = _EMPTY_TIME_OF_DAY
+            null_mask[i] = null_value is None
+    hours = np.fromiter((record.hours for record in records), np.int64, count=count)
+    minutes = np.fromiter((record.minutes for record in records), np.int64, count=count)
+    seconds = np.fromiter((record.seconds for record in records), np.int64, count=count)
+    nanos = np.fromiter((record.nanos for record in records), np.int64, count=count)
+    total = ((hours * 60 + minutes) * 60 + seconds) * 1_000_000_000 + nanos
+    divisor = _TIME_OF_DAY_UNIT_DIVISORS[data_type.unit]
+    if divisor != 1:
+        total //= divisor
+    return pa.array(total.astype(dtype, copy=False), data_type, mask=null_mask)
+
+
 def _proto_field_to_array(
     proto_field_values: Iterable[Any],
     field_descriptor: FieldDescriptor,
     validity_mask: Optional[Sequence[bool]],
     config: ProtarrowConfig,
 ) -> pa.Array:
+    if (
+        field_descriptor.type == FieldDescriptorProto.TYPE_ENUM
+        and not pa.types.is_integer(config.enum_type)
+    ):
+        null_number = (
+            None
+            if (
+                field_descriptor.has_presence
+                or field_descriptor.label == FieldDescriptor.LABEL_REPEATED
+            )
+            else field_descriptor.default_value
+        )
+        return _enum_field_to_array(
+            proto_field_values,
+            field_descriptor.enum_type,
+            null_number,
+            config.enum_type,
+            validity_mask,
+        )
+    if field_descriptor.message_type == TimeOfDay.DESCRIPTOR:
+        # Message fields always have presence, so missing records map to null
+        data_type = field_descriptor_to_data_type(field_descriptor, config)
+        return _time_of_day_to_numpy_array(
+            proto_field_values, None, _numpy_dtype(data_type), data_type, validity_mask
+        )
+    if field_descriptor.message_type == Date.DESCRIPTOR:
+        return _date_to_numpy_array(proto_field_values, None, validity_mask)
     converter = _get_converter(field_descriptor, config)
 
     if converter is not None:
@@ -353,6 +516,30 @@ def _proto_field_to_array(
             )
             else converter(field_descriptor.default_value)
         )
+        dtype = _numpy_dtype(data_type)
+        if dtype is not None:
+            return _proto_field_to_numpy_array(
+                proto_field_values,
+                converter,
+                null_value,
+                dtype,
+                data_type,
+                validity_mask,
+            )
+        if converter is _identity:
+            # string and binary values go to `pa.array` as they are,
+            # there is no need for a converter call per record
+            if validity_mask is None:
+                values = [
+                    null_value if record is None else record
+                    for record in proto_field_values
+                ]
+            else:
+                values = [
+                    record if (valid and record is not None) else null_value
+                    for record, valid in zip(proto_field_values, validity_mask)
+                ]
+            return pa.array(values, data_type)
         array = []
         for i, record in enumerate(proto_field_values):
             if record is None or not (validity_mask is None or validity_mask[i]):
@@ -420,15 +607,27 @@ def _proto_map_to_array(
     """
     key_field = field_descriptor.message_type.fields_by_name["key"]
     value_field = field_descriptor.message_type.fields_by_name["value"]
-    offsets = _get_offsets(maps)
+    offsets: List[Optional[int]] = []
+    map_keys: List[Any] = []
+    map_values: List[Any] = []
+    last_offset = 0
+    for record in maps:
+        if record is None:
+            offsets.append(None)
+        else:
+            offsets.append(last_offset)
+            map_keys.extend(record.keys())
+            map_values.extend(record.values())
+            last_offset += len(record)
+    offsets.append(last_offset)
     keys = _proto_field_to_array(
-        MapKeyIterable(maps),
+        map_keys,
         key_field,
         validity_mask=None,
         config=config,
     )
     values = _proto_field_to_array(
-        MapValueIterable(maps),
+        map_values,
         value_field,
         validity_mask=None,
         config=config,
@@ -454,19 +653,48 @@ def _proto_field_nullable(
         return field_descriptor.has_presence
 
 
-def _proto_field_validity_mask(
-    messages: Iterable[Message], field_descriptor: FieldDescriptor
-) -> Optional[List[bool]]:
-    if not field_descriptor.has_presence:
-        return None
-    mask = []
+def _singular_field_to_array(
+    messages: Iterable[Optional[Message]],
+    field_descriptor: FieldDescriptor,
+    config: ProtarrowConfig,
+) -> pa.Array:
+    """
+    Convert a non-repeated field to an array, computing the values and their
+    validity in a single pass over the messages instead of one pass for each.
+    """
     field_name = field_descriptor.name
-    for record in messages:
-        if record is None:
-            mask.append(False)
-        else:
-            mask.append(record.HasField(field_name))
-    return mask
+    if field_descriptor.message_type in _WRAPPER_DESCRIPTORS:
+        # Unwrap the primitive directly instead of going through a converter
+        # closure for the wrapper message and another one for its value
+        return pa.array(
+            [
+                (
+                    getattr(message, field_name).value
+                    if message is not None and message.HasField(field_name)
+                    else None
+                )
+                for message in messages
+            ],
+            _PROTO_DESCRIPTOR_TO_PYARROW[field_descriptor.message_type],
+        )
+    if field_descriptor.has_presence:
+        values = []
+        validity_mask = []
+        for message in messages:
+            if message is not None and message.HasField(field_name):
+                values.append(getattr(message, field_name))
+                validity_mask.append(True)
+            else:
+                values.append(None)
+                validity_mask.append(False)
+        return _proto_field_to_array(values, field_descriptor, validity_mask, config)
+    else:
+        return _proto_field_to_array(
+            NestedIterable(messages, operator.attrgetter(field_name)),
+            field_descriptor,
+            validity_mask=None,
+            config=config,
+        )
 
 
 def _messages_to_array(
@@ -479,26 +707,18 @@ def _messages_to_array(
     fields = []
 
     for field_descriptor in descriptor.fields:
-        if (
-            field_descriptor.type == FieldDescriptor.TYPE_MESSAGE
-            and field_descriptor.label != FieldDescriptor.LABEL_REPEATED
-        ):
-            field_values = NestedIterable(
-                messages, NestedMessageGetter(field_descriptor.name)
-            )
-        else:
+        if is_map(field_descriptor):
             field_values = NestedIterable(
                 messages, operator.attrgetter(field_descriptor.name)
             )
-        if is_map(field_descriptor):
             array = _proto_map_to_array(field_values, field_descriptor, config)
         elif field_descriptor.label == FieldDescriptorProto.LABEL_REPEATED:
+            field_values = NestedIterable(
+                messages, operator.attrgetter(field_descriptor.name)
+            )
             array = _repeated_proto_to_array(field_values, field_descriptor, config)
         else:
-            mask = _proto_field_validity_mask(messages, field_descriptor)
-            array = _proto_field_to_array(
-                field_values, field_descriptor, validity_mask=mask, config=config
-            )
+            array = _singular_field_to_array(messages, field_descriptor, config)
 
         arrays.append(array)
         fields.append(
@@ -1,7 +1,6 @@
-import json
 from pathlib import Path
 
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.json_format import MessageToJson
 
 from protarrow_protos.bench_pb2 import (
     ExampleMessage,
@@ -24,10 +23,12 @@ def main():
             DIR.parent / "tests" / "data" / (message_type.DESCRIPTOR.name + ".jsonl")
         ).as_posix()
         print(file_name)
+        lines = [
+            MessageToJson(message, preserving_proto_field_name=True, indent=None)
+            for message in messages
+        ]
         with open(file_name, "w") as fp:
-            for message in messages:
-                json.dump(MessageToDict(message, preserving_proto_field_name=True), fp)
-                fp.write("\n")
+            fp.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
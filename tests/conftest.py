@@ -0,0 +1,73 @@
+import pathlib
+from typing import Dict, List, Type
+
+import pyarrow as pa
+import pytest
+from google.protobuf.json_format import Parse
+from google.protobuf.message import Message
+
+from protarrow.common import M
+from protarrow.proto_to_arrow import message_type_to_schema
+from protarrow_protos.bench_pb2 import (
+    ExampleMessage,
+    NestedExampleMessage,
+    SuperNestedExampleMessage,
+)
+from tests.random_generator import generate_messages
+
+MESSAGES = [ExampleMessage, NestedExampleMessage, SuperNestedExampleMessage]
+
+_RANDOM_MESSAGES_CACHE: Dict[Type[Message], List[Message]] = {}
+_SAMPLE_MESSAGES_CACHE: Dict[Type[Message], List[Message]] = {}
+
+
+def read_proto_jsonl(path: pathlib.Path, message_type: Type[M]) -> List[M]:
+    with path.open() as fp:
+        return [
+            Parse(line.strip(), message_type())
+            for line in fp
+            if line.strip() and not line.startswith("#")
+        ]
+
+
+def _fresh_copies(messages: List[M], message_type: Type[M]) -> List[M]:
+    return [
+        message_type.FromString(message.SerializeToString()) for message in messages
+    ]
+
+
+@pytest.fixture(params=MESSAGES, ids=lambda message_type: message_type.DESCRIPTOR.name)
+def message_type(request) -> Type[Message]:
+    return request.param
+
+
+@pytest.fixture()
+def random_messages(message_type: Type[M]) -> List[M]:
+    """Random messages generated once per type, copied fresh for each test"""
+    try:
+        pristine = _RANDOM_MESSAGES_CACHE[message_type]
+    except KeyError:
+        pristine = generate_messages(message_type, 10)
+        _RANDOM_MESSAGES_CACHE[message_type] = pristine
+    return _fresh_copies(pristine, message_type)
+
+
+@pytest.fixture()
+def sample_messages(message_type: Type[M]) -> List[M]:
+    """Sample messages parsed once per type, copied fresh for each test"""
+    try:
+        pristine = _SAMPLE_MESSAGES_CACHE[message_type]
+    except KeyError:
+        source_file = (
+            pathlib.Path(__file__).parent
+            / "data"
+            / f"{message_type.DESCRIPTOR.name}.jsonl"
+        )
+        pristine = read_proto_jsonl(source_file, message_type)
+        _SAMPLE_MESSAGES_CACHE[message_type] = pristine
+    return _fresh_copies(pristine, message_type)
+
+
+@pytest.fixture(scope="session")
+def example_message_schema() -> pa.Schema:
+    return message_type_to_schema(ExampleMessage)
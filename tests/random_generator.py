@@ -1,8 +1,16 @@
+import base64
+import concurrent.futures
 import datetime
+import functools
+import importlib
+import operator
+import os
 import random
-import secrets
+import sys
 import typing
 
+import numpy as np
+from google.protobuf import symbol_database
 from google.protobuf.descriptor import EnumDescriptor, FieldDescriptor
 from google.protobuf.message import Message
 from google.protobuf.timestamp_pb2 import Timestamp
@@ -17,44 +25,144 @@ EPOCH_RATIO = 24 * 60 * 60
 UNIT_IN_NANOS = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
 
 
+_BYTES_POOL = random.randbytes(1 << 20)
+_BYTES_POOL_CURSOR = 0
+
+
+def _take_bytes(size: int) -> bytes:
+    """Slice from a shared pre-filled buffer instead of drawing fresh random
+    bytes per call, wrapping at a random offset to avoid repeating slices"""
+    global _BYTES_POOL_CURSOR
+    if _BYTES_POOL_CURSOR + size > len(_BYTES_POOL):
+        _BYTES_POOL_CURSOR = random.randrange(256)
+    value = _BYTES_POOL[_BYTES_POOL_CURSOR : _BYTES_POOL_CURSOR + size]
+    _BYTES_POOL_CURSOR += size
+    return value
+
+
 def random_string(count: int) -> str:
-    return secrets.token_urlsafe(random.randint(0, count))
+    return (
+        base64.urlsafe_b64encode(_take_bytes(random.randint(0, count)))
+        .rstrip(b"=")
+        .decode("ascii")
+    )
 
 
 def random_bytes(count: int) -> bytes:
-    return secrets.token_bytes(random.randint(0, count))
+    return _take_bytes(random.randint(0, count))
+
+
+_RNG = np.random.default_rng()
+_POOL_SIZE = 65536
+
+
+class _ScalarPool:
+    """
+    Pre-drawn random scalars, refilled with a single vectorized numpy call
+    instead of one Python-level RNG call per value.
+    """
+
+    def __init__(self, refill: typing.Callable[[int], np.ndarray]):
+        self._refill = refill
+        self._values: typing.List[typing.Any] = []
+        self._cursor = 0
+
+    def next(self) -> typing.Any:
+        if self._cursor == len(self._values):
+            self._values = self._refill(_POOL_SIZE).tolist()
+            self._cursor = 0
+        value = self._values[self._cursor]
+        self._cursor += 1
+        return value
+
+    def take(self, size: int) -> typing.List[typing.Any]:
+        if self._cursor + size > len(self._values):
+            self._values = self._refill(max(_POOL_SIZE, size)).tolist()
+            self._cursor = 0
+        values = self._values[self._cursor : self._cursor + size]
+        self._cursor += size
+        return values
+
+
+_SCALAR_POOLS = {
+    FieldDescriptor.CPPTYPE_INT32: _ScalarPool(
+        lambda size: _RNG.integers(
+            -(2**31), 2**31 - 1, size, np.int64, endpoint=True
+        )
+    ),
+    FieldDescriptor.CPPTYPE_INT64: _ScalarPool(
+        lambda size: _RNG.integers(
+            -(2**63), 2**63 - 1, size, np.int64, endpoint=True
+        )
+    ),
+    FieldDescriptor.CPPTYPE_UINT32: _ScalarPool(
+        lambda size: _RNG.integers(0, 2**32 - 1, size, np.uint64, endpoint=True)
+    ),
+    FieldDescriptor.CPPTYPE_UINT64: _ScalarPool(
+        lambda size: _RNG.integers(0, 2**64 - 1, size, np.uint64, endpoint=True)
+    ),
+    FieldDescriptor.CPPTYPE_DOUBLE: _ScalarPool(lambda size: _RNG.uniform(-1, 1, size)),
+    FieldDescriptor.CPPTYPE_FLOAT: _ScalarPool(lambda size: _RNG.uniform(-1, 1, size)),
+    FieldDescriptor.CPPTYPE_BOOL: _ScalarPool(
+        lambda size: _RNG.integers(0, 1, size, np.bool_, endpoint=True)
+    ),
+}
+
+_TIMESTAMP_SECONDS_POOL = _ScalarPool(
+    lambda size: _RNG.integers(-9223372036, 9223372035, size, np.int64, endpoint=True)
+)
+_NANOS_POOL = _ScalarPool(
+    lambda size: _RNG.integers(0, 999_999_999, size, np.int64, endpoint=True)
+)
+_HOURS_POOL = _ScalarPool(
+    lambda size: _RNG.integers(0, 23, size, np.int64, endpoint=True)
+)
+_SIXTIETHS_POOL = _ScalarPool(
+    lambda size: _RNG.integers(0, 59, size, np.int64, endpoint=True)
+)
+
+_DATE_MIN_ORDINAL = datetime.date.min.toordinal()
+_DATE_MAX_SPAN = datetime.date.max.toordinal() - _DATE_MIN_ORDINAL
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
 
 
 def random_timestamp() -> Timestamp:
     return Timestamp(
-        seconds=random.randint(-9223372036, 9223372035),
-        nanos=random.randint(0, 999_999_999),
+        seconds=_TIMESTAMP_SECONDS_POOL.next(),
+        nanos=_NANOS_POOL.next(),
     )
 
 
 def random_date() -> Date:
-    date = datetime.date.min + datetime.timedelta(days=random.randint(0, 3652058))
-    return Date(year=date.year, month=date.month, day=date.day)
+    """Draw a proleptic Gregorian ordinal and split it with integer arithmetic,
+    without allocating intermediate `datetime` objects."""
+    days = _DATE_MIN_ORDINAL + random.randint(0, _DATE_MAX_SPAN) - _EPOCH_ORDINAL
+    shifted_days = days + 719468
+    era = shifted_days // 146097
+    day_of_era = shifted_days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        year_of_era * 365 + year_of_era // 4 - year_of_era // 100
+    )
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    year = year_of_era + era * 400 + (month <= 2)
+    return Date(year=year, month=month, day=day)
 
 
 def random_time_of_day() -> TimeOfDay:
     return TimeOfDay(
-        hours=random.randint(0, 23),
-        minutes=random.randint(0, 59),
-        seconds=random.randint(0, 59),
-        nanos=random.randint(0, 999_999_999),
+        hours=_HOURS_POOL.next(),
+        minutes=_SIXTIETHS_POOL.next(),
+        seconds=_SIXTIETHS_POOL.next(),
+        nanos=_NANOS_POOL.next(),
     )
 
 
-CPP_TYPE_GENERATOR = {
-    FieldDescriptor.CPPTYPE_INT32: lambda: random.randint(-(2**31), 2**31 - 1),
-    FieldDescriptor.CPPTYPE_INT64: lambda: random.randint(-(2**63), 2**63 - 1),
-    FieldDescriptor.CPPTYPE_UINT32: lambda: random.randint(0, 2**32 - 1),
-    FieldDescriptor.CPPTYPE_UINT64: lambda: random.randint(0, 2**64 - 1),
-    FieldDescriptor.CPPTYPE_DOUBLE: lambda: random.uniform(-1, 1),
-    FieldDescriptor.CPPTYPE_FLOAT: lambda: random.uniform(-1, 1),
-    FieldDescriptor.CPPTYPE_BOOL: lambda: bool(random.getrandbits(1)),
-}
+CPP_TYPE_GENERATOR = {cpp_type: pool.next for cpp_type, pool in _SCALAR_POOLS.items()}
 
 TYPE_GENERATOR = {
     FieldDescriptor.TYPE_BYTES: random_bytes,
@@ -68,113 +176,326 @@ MESSAGE_GENERATORS = {
 }
 
 
+class _FieldPlan(typing.NamedTuple):
+    """Pre-resolved generation recipe for one field"""
+
+    name: str
+    getter: typing.Callable[[Message], typing.Any]
+    repeated: bool
+    is_map: bool
+    map_value_is_message: bool
+    has_presence: bool
+    is_message: bool
+    optional_message: bool
+    generator: typing.Callable[[], typing.Any]
+    repeated_builder: typing.Optional[typing.Callable[[], typing.List[typing.Any]]]
+
+
+class _MessagePlan(typing.NamedTuple):
+    """Pre-resolved generation recipe for one message type"""
+
+    message_type: typing.Type[Message]
+    oneofs: typing.List[typing.List[_FieldPlan]]
+    fields: typing.List[_FieldPlan]
+
+
+_FIELD_PLANS: typing.Dict[typing.Tuple[FieldDescriptor, int], _FieldPlan] = {}
+_PLAN_CACHE: typing.Dict[typing.Any, _MessagePlan] = {}
+
+
+def _bind_generator(
+    field: FieldDescriptor, count: int
+) -> typing.Callable[[], typing.Any]:
+    """Resolve the type dispatch of a field once, at plan time"""
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        indices = _enum_indices(field.enum_type)
+        return lambda: indices[random.randrange(len(indices))]
+    elif field.message_type in MESSAGE_GENERATORS:
+        return MESSAGE_GENERATORS[field.message_type]
+    elif field.type == FieldDescriptor.TYPE_MESSAGE:
+        return functools.partial(
+            generate_message, field.message_type._concrete_class, count
+        )
+    elif field.type in TYPE_GENERATOR:
+        return functools.partial(TYPE_GENERATOR[field.type], count)
+    else:
+        return CPP_TYPE_GENERATOR[field.cpp_type]
+
+
+def _bind_repeated_builder(
+    field: FieldDescriptor, count: int
+) -> typing.Callable[[], typing.List[typing.Any]]:
+    """
+    Bind a type-specific builder of lists of random values, so that growing
+    a repeated field does not re-dispatch on the field type per element.
+    """
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        indices = _enum_indices(field.enum_type)
+        return lambda: random.choices(indices, k=random.randint(0, count))
+    elif field.message_type in MESSAGE_GENERATORS:
+        generator = MESSAGE_GENERATORS[field.message_type]
+        return lambda: [generator() for _ in range(random.randint(0, count))]
+    elif field.type == FieldDescriptor.TYPE_MESSAGE:
+        concrete_class = field.message_type._concrete_class
+        return lambda: [
+            generate_message(concrete_class, count)
+            for _ in range(random.randint(0, count))
+        ]
+    elif field.type in TYPE_GENERATOR:
+        generator = TYPE_GENERATOR[field.type]
+        return lambda: [generator(count) for _ in range(random.randint(0, count))]
+    else:
+        pool = _SCALAR_POOLS[field.cpp_type]
+        return lambda: pool.take(random.randint(0, count))
+
+
+def _field_plan(field: FieldDescriptor, count: int) -> _FieldPlan:
+    try:
+        return _FIELD_PLANS[(field, count)]
+    except KeyError:
+        repeated = field.label == FieldDescriptor.LABEL_REPEATED
+        is_message = field.type == FieldDescriptor.TYPE_MESSAGE
+        plan = _FieldPlan(
+            name=field.name,
+            getter=operator.attrgetter(field.name),
+            repeated=repeated,
+            is_map=is_map(field),
+            map_value_is_message=(
+                is_map(field)
+                and field.message_type.fields_by_name["value"].type
+                == FieldDescriptor.TYPE_MESSAGE
+            ),
+            has_presence=field.has_presence,
+            is_message=is_message,
+            optional_message=not repeated and is_message,
+            generator=_bind_generator(field, count),
+            repeated_builder=_bind_repeated_builder(field, count) if repeated else None,
+        )
+        _FIELD_PLANS[(field, count)] = plan
+        return plan
+
+
+def _message_plan(message_type: typing.Type[M], count: int) -> _MessagePlan:
+    descriptor = message_type.DESCRIPTOR
+    try:
+        return _PLAN_CACHE[(descriptor, count)]
+    except KeyError:
+        plan = _MessagePlan(
+            message_type=message_type,
+            oneofs=[
+                [_field_plan(field, count) for field in one_of.fields]
+                for one_of in descriptor.oneofs
+            ],
+            fields=[
+                _field_plan(field, count)
+                for field in descriptor.fields
+                if field.containing_oneof is None
+            ],
+        )
+        _PLAN_CACHE[(descriptor, count)] = plan
+        return plan
+
+
 def generate_message(message_type: typing.Type[M], repeated_count: int) -> M:
     message = message_type()
-    for one_of in message_type.DESCRIPTOR.oneofs:
-        one_of_index = random.randint(0, len(one_of.fields))
-        if one_of_index < len(one_of.fields):
-            field = one_of.fields[one_of_index]
-            set_field(message, field, repeated_count)
-
-    for field in message_type.DESCRIPTOR.fields:
-        if field.containing_oneof is None:
-            if (
-                field.label == FieldDescriptor.LABEL_REPEATED
-                or field.type != FieldDescriptor.TYPE_MESSAGE
-                or random.getrandbits(1) == 1
-            ):
-                set_field(message, field, repeated_count)
+    plan = _message_plan(message_type, repeated_count)
+    for one_of_fields in plan.oneofs:
+        one_of_index = random.randint(0, len(one_of_fields))
+        if one_of_index < len(one_of_fields):
+            _set_field(message, one_of_fields[one_of_index])
+
+    for field_plan in plan.fields:
+        if not field_plan.optional_message or random.getrandbits(1) == 1:
+            _set_field(message, field_plan)
     return message
 
 
+def _module_name(message_type: typing.Type[Message]) -> str:
+    """Importable name of the module defining a message class. protoc names
+    generated modules after the proto file, which can differ from the path
+    they are imported from."""
+    name = message_type.__module__
+    if name in sys.modules:
+        return name
+    return next(
+        name
+        for name, module in sys.modules.items()
+        if getattr(module, message_type.__name__, None) is message_type
+    )
+
+
+def _generate_serialized(
+    module_name: str, full_name: str, count: int, repeated_count: int
+) -> typing.List[bytes]:
+    """Generate messages in a worker process, returned in their wire format
+    because descriptors do not pickle"""
+    # Under the spawn start method the worker starts with an empty descriptor
+    # pool, so the generated module must be imported before the symbol lookup
+    importlib.import_module(module_name)
+    message_type = symbol_database.Default().GetSymbol(full_name)
+    return [
+        generate_message(message_type, repeated_count).SerializeToString()
+        for _ in range(count)
+    ]
+
+
 def generate_messages(
-    message_type: typing.Type[M], count: int, repeated_count: int = 10
+    message_type: typing.Type[M],
+    count: int,
+    repeated_count: int = 10,
+    workers: typing.Optional[int] = None,
 ) -> typing.List[M]:
+    """
+    Generate `count` random messages, sharding the work over a process pool
+    for large counts as message construction is GIL bound.
+    """
+    if workers is None:
+        workers = os.cpu_count() if count >= 64 else 1
+    if workers > 1:
+        chunks = [
+            count // workers + (1 if index < count % workers else 0)
+            for index in range(workers)
+        ]
+        full_name = message_type.DESCRIPTOR.full_name
+        module_name = _module_name(message_type)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _generate_serialized, module_name, full_name, chunk, repeated_count
+                )
+                for chunk in chunks
+                if chunk > 0
+            ]
+            return [
+                message_type.FromString(payload)
+                for future in futures
+                for payload in future.result()
+            ]
     return [generate_message(message_type, repeated_count) for _ in range(count)]
 
 
 def set_field(message: Message, field: FieldDescriptor, count: int) -> None:
-    data = generate_field_data(field, count)
+    _set_field(message, _field_plan(field, count))
 
-    if field.label == FieldDescriptor.LABEL_REPEATED:
-        field_value = getattr(message, field.name)
-        if is_map(field):
-            if (
-                field.message_type.fields_by_name["value"].type
-                == FieldDescriptor.TYPE_MESSAGE
-            ):
+
+def _set_field(message: Message, field_plan: _FieldPlan) -> None:
+    if field_plan.repeated:
+        data = field_plan.repeated_builder()
+        field_value = field_plan.getter(message)
+        if field_plan.is_map:
+            if field_plan.map_value_is_message:
                 for entry in data:
                     field_value[entry.key].MergeFrom(entry.value)
             else:
-                for entry in data:
-                    field_value[entry.key] = entry.value
+                # one C-level call instead of one `__setitem__` per entry
+                field_value.update({entry.key: entry.value for entry in data})
         else:
             field_value.extend(data)
-    elif field.has_presence:
+    elif field_plan.has_presence:
         if random.getrandbits(1) == 1:
-            if field.type == FieldDescriptor.TYPE_MESSAGE:
-                getattr(message, field.name).CopyFrom(data)
+            if field_plan.is_message:
+                field_plan.getter(message).CopyFrom(field_plan.generator())
             else:
-                setattr(message, field.name, data)
+                setattr(message, field_plan.name, field_plan.generator())
     else:
-        setattr(message, field.name, data)
+        setattr(message, field_plan.name, field_plan.generator())
 
 
-def generate_field_data(field: FieldDescriptor, count: int):
-    if field.label == FieldDescriptor.LABEL_REPEATED:
-        size = random.randint(0, count)
-        return [_generate_data(field, count) for _ in range(size)]
-    else:
-        return _generate_data(field, count)
+_ENUM_INDEX_CACHE: typing.Dict[EnumDescriptor, typing.Tuple[int, ...]] = {}
 
 
-def _generate_data(field: FieldDescriptor, count: int) -> typing.Any:
-    if field.type == FieldDescriptor.TYPE_ENUM:
-        return _generate_enum(field.enum_type)
-    elif field.message_type in MESSAGE_GENERATORS:
-        return MESSAGE_GENERATORS[field.message_type]()
-    elif field.type == FieldDescriptor.TYPE_MESSAGE:
-        return generate_message(field.message_type._concrete_class, count)
-    elif field.type in TYPE_GENERATOR:
-        return TYPE_GENERATOR[field.type](count)
-    else:
-        return CPP_TYPE_GENERATOR[field.cpp_type]()
+def _enum_indices(enum: EnumDescriptor) -> typing.Tuple[int, ...]:
+    try:
+        return _ENUM_INDEX_CACHE[enum]
+    except KeyError:
+        indices = tuple(value.index for value in enum.values)
+        _ENUM_INDEX_CACHE[enum] = indices
+        return indices
 
 
 def _generate_enum(enum: EnumDescriptor) -> int:
-    return random.choice(enum.values).index
+    indices = _enum_indices(enum)
+    return indices[random.randrange(len(indices))]
 
 
-def truncate_nanos(message: Message, timestamp_unit: str, time_unit: str) -> Message:
-    if message.DESCRIPTOR == Timestamp.DESCRIPTOR:
-        message.nanos = (
-            message.nanos // UNIT_IN_NANOS[timestamp_unit]
-        ) * UNIT_IN_NANOS[timestamp_unit]
-    elif message.DESCRIPTOR == TimeOfDay.DESCRIPTOR:
-        message.nanos = (message.nanos // UNIT_IN_NANOS[time_unit]) * UNIT_IN_NANOS[
-            time_unit
-        ]
-    else:
-        for field in message.DESCRIPTOR.fields:
+_TRUNC_SINGULAR = 0
+_TRUNC_REPEATED = 1
+_TRUNC_MAP = 2
+
+_TRUNC_PLANS: typing.Dict[
+    typing.Any,
+    typing.List[typing.Tuple[str, int, typing.Callable[[Message], typing.Any]]],
+] = {}
+
+
+_HAS_TEMPORAL: typing.Dict[typing.Any, bool] = {}
+
+
+def _has_temporal(descriptor) -> bool:
+    """Whether a Timestamp or TimeOfDay is transitively reachable from a
+    descriptor, so truncation can skip whole subtrees"""
+    try:
+        return _HAS_TEMPORAL[descriptor]
+    except KeyError:
+        result = _has_temporal_dfs(descriptor, set())
+        _HAS_TEMPORAL[descriptor] = result
+        return result
+
+
+def _has_temporal_dfs(descriptor, seen: typing.Set[typing.Any]) -> bool:
+    if descriptor in (Timestamp.DESCRIPTOR, TimeOfDay.DESCRIPTOR):
+        return True
+    if descriptor in seen:
+        return False
+    seen.add(descriptor)
+    return any(
+        field.type == FieldDescriptor.TYPE_MESSAGE
+        and _has_temporal_dfs(field.message_type, seen)
+        for field in descriptor.fields
+    )
+
+
+def _trunc_plan(
+    descriptor,
+) -> typing.List[typing.Tuple[str, int, typing.Callable[[Message], typing.Any]]]:
+    """List, once per descriptor, the message fields truncation recurses into"""
+    try:
+        return _TRUNC_PLANS[descriptor]
+    except KeyError:
+        plan = []
+        for field in descriptor.fields:
             if field.type == FieldDescriptor.TYPE_MESSAGE:
+                getter = operator.attrgetter(field.name)
                 if field.label == FieldDescriptor.LABEL_REPEATED:
-                    field_value = getattr(message, field.name)
-                    if (
-                        field.message_type is not None
-                        and field.message_type.GetOptions().map_entry
-                    ):
+                    if field.message_type.GetOptions().map_entry:
+                        value_field = field.message_type.fields_by_name["value"]
                         if (
-                            field.message_type.fields_by_name["value"].type
-                            == FieldDescriptor.TYPE_MESSAGE
+                            value_field.type == FieldDescriptor.TYPE_MESSAGE
+                            and _has_temporal(value_field.message_type)
                         ):
-                            for key, value in field_value.items():
-                                truncate_nanos(value, timestamp_unit, time_unit)
-
-                    else:
-                        for item in field_value:
-                            truncate_nanos(item, timestamp_unit, time_unit)
-                elif message.HasField(field.name):
-                    truncate_nanos(
-                        getattr(message, field.name), timestamp_unit, time_unit
-                    )
+                            plan.append((field.name, _TRUNC_MAP, getter))
+                    elif _has_temporal(field.message_type):
+                        plan.append((field.name, _TRUNC_REPEATED, getter))
+                elif _has_temporal(field.message_type):
+                    plan.append((field.name, _TRUNC_SINGULAR, getter))
+        _TRUNC_PLANS[descriptor] = plan
+        return plan
+
+
+def truncate_nanos(message: Message, timestamp_unit: str, time_unit: str) -> Message:
+    descriptor = message.DESCRIPTOR
+    if descriptor == Timestamp.DESCRIPTOR:
+        message.nanos -= message.nanos % UNIT_IN_NANOS[timestamp_unit]
+    elif descriptor == TimeOfDay.DESCRIPTOR:
+        message.nanos -= message.nanos % UNIT_IN_NANOS[time_unit]
+    else:
+        for name, kind, getter in _trunc_plan(descriptor):
+            if kind == _TRUNC_REPEATED:
+                for item in getter(message):
+                    truncate_nanos(item, timestamp_unit, time_unit)
+            elif kind == _TRUNC_MAP:
+                for value in getter(message).values():
+                    truncate_nanos(value, timestamp_unit, time_unit)
+            elif message.HasField(name):
+                truncate_nanos(getter(message), timestamp_unit, time_unit)
     return message
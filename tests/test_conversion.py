@@ -1,11 +1,9 @@
-import pathlib
 from typing import Any, Iterable, List, Type
 
 import pyarrow as pa
 import pytest
 from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.empty_pb2 import Empty
-from google.protobuf.json_format import Parse
 from google.protobuf.message import Message
 from google.protobuf.timestamp_pb2 import Timestamp
 from google.type.timeofday_pb2 import TimeOfDay
@@ -14,6 +12,7 @@ import protarrow
 from protarrow.arrow_to_proto import (
     create_enum_converter,
     is_custom_field,
+    record_batch_to_messages,
     table_to_messages,
 )
 from protarrow.cast_to_proto import (
@@ -23,7 +22,7 @@ from protarrow.cast_to_proto import (
     get_casted_array,
     maybe_copy_offsets,
 )
-from protarrow.common import M, ProtarrowConfig, offset_values_array
+from protarrow.common import ProtarrowConfig, offset_values_array
 from protarrow.message_extractor import MessageExtractor
 from protarrow.proto_to_arrow import (
     NestedIterable,
@@ -34,15 +33,11 @@ from protarrow.proto_to_arrow import (
     messages_to_record_batch,
     messages_to_table,
 )
-from protarrow_protos.bench_pb2 import (
-    ExampleMessage,
-    NestedExampleMessage,
-    SuperNestedExampleMessage,
-)
+from protarrow_protos.bench_pb2 import ExampleMessage, NestedExampleMessage
 from protarrow_protos.example_pb2 import EmptyMessage, NestedEmptyMessage
+from tests.conftest import MESSAGES
 from tests.random_generator import generate_messages, truncate_nanos
 
-MESSAGES = [ExampleMessage, NestedExampleMessage, SuperNestedExampleMessage]
 CONFIGS = [
     ProtarrowConfig(),
     ProtarrowConfig(enum_type=pa.binary()),
@@ -71,15 +66,6 @@ CONFIGS = [
 ]
 
 
-def read_proto_jsonl(path: pathlib.Path, message_type: Type[M]) -> List[M]:
-    with path.open() as fp:
-        return [
-            Parse(line.strip(), message_type())
-            for line in fp
-            if line.strip() and not line.startswith("#")
-        ]
-
-
 @pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
 def test_arrow_to_proto_empty(message_type: Type[Message], config: ProtarrowConfig):
@@ -99,10 +85,13 @@ def test_message_type_to_struct_type(
     assert isinstance(struct_type, pa.StructType)
 
 
-@pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
-def test_with_random(message_type: Type[Message], config: ProtarrowConfig):
-    source_messages = generate_messages(message_type, 10)
+def test_with_random(
+    message_type: Type[Message],
+    config: ProtarrowConfig,
+    random_messages: List[Message],
+):
+    source_messages = random_messages
     table = messages_to_table(source_messages, message_type, config)
     messages_back = table_to_messages(table, message_type)
     truncated_messages = [
@@ -128,14 +117,13 @@ def test_with_random_not_aligned(
     _check_messages_same(truncated_messages, messages_back)
 
 
-@pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
-def test_with_sample_data(message_type: Type[Message], config: ProtarrowConfig):
-    source_file = (
-        pathlib.Path(__file__).parent / "data" / f"{message_type.DESCRIPTOR.name}.jsonl"
-    )
-    source_messages = read_proto_jsonl(source_file, message_type)
-
+def test_with_sample_data(
+    message_type: Type[Message],
+    config: ProtarrowConfig,
+    sample_messages: List[Message],
+):
+    source_messages = sample_messages
     table = messages_to_table(source_messages, message_type, config)
     messages_back = table_to_messages(table, message_type)
     truncated_messages = [
@@ -145,7 +133,24 @@ def test_with_sample_data(message_type: Type[Message], config: ProtarrowConfig):
     _check_messages_same(truncated_messages, messages_back)
 
 
-def test_wrapped_type_nullable():
+def test_table_to_messages_multi_batch(
+    message_type: Type[Message], random_messages: List[Message]
+):
+    table = messages_to_table(random_messages, message_type)
+    table = pa.concat_tables([table, table])
+    assert len(table.to_batches()) > 1
+    expected = [
+        message
+        for batch in table.to_batches()
+        for message in record_batch_to_messages(batch, message_type)
+    ]
+    _check_messages_same(table_to_messages(table, message_type), expected)
+    _check_messages_same(
+        table_to_messages(table, message_type, parallel=False), expected
+    )
+
+
+def test_wrapped_type_nullable(example_message_schema: pa.Schema):
     expected_types = {
         "wrapped_double_value": pa.float64(),
         "wrapped_float_value": pa.float32(),
@@ -158,15 +163,13 @@ def test_wrapped_type_nullable():
         "wrapped_bytes_value": pa.binary(),
     }
 
-    table = messages_to_table([], ExampleMessage)
-    schema = table.schema
     for name, expected_type in expected_types.items():
-        field = schema.field(name)
+        field = example_message_schema.field(name)
         assert field.type == expected_type
         assert field.nullable is True
 
 
-def test_native_type_not_nullable():
+def test_native_type_not_nullable(example_message_schema: pa.Schema):
     expected_types = {
         "double_value": pa.float64(),
         "float_value": pa.float32(),
@@ -179,10 +182,8 @@ def test_native_type_not_nullable():
         "bytes_value": pa.binary(),
     }
 
-    table = messages_to_table([], ExampleMessage)
-    schema = table.schema
     for name, expected_type in expected_types.items():
-        field = schema.field(name)
+        field = example_message_schema.field(name)
         assert field.type == expected_type
         assert field.nullable is False
 
@@ -397,9 +398,17 @@ def test_get_arrow_default_value(enum_type: pa.DataType, expected: Any):
 
 
 def _check_messages_same(actual: Iterable[Message], expected: Iterable[Message]):
-    for left, right in zip(actual, expected):
-        assert left == right
-    assert actual == expected
+    actual = list(actual)
+    expected = list(expected)
+    actual_bytes = [message.SerializeToString(deterministic=True) for message in actual]
+    expected_bytes = [
+        message.SerializeToString(deterministic=True) for message in expected
+    ]
+    if actual_bytes != expected_bytes:
+        # Fall back to message equality for a readable failure
+        for left, right in zip(actual, expected):
+            assert left == right
+        assert actual == expected
 
 
 def test_nested_field_values_not_null_when_message_missing():
@@ -439,20 +448,24 @@ def test_cast_empty(message_type: Type[Message], config: ProtarrowConfig):
     assert casted_table.schema == message_type_to_schema(message_type, config)
 
 
-@pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
-def test_cast_same(message_type: Type[Message], config: ProtarrowConfig):
-    source_messages = generate_messages(message_type, 10)
-    table = messages_to_table(source_messages, message_type, config)
+def test_cast_same(
+    message_type: Type[Message],
+    config: ProtarrowConfig,
+    random_messages: List[Message],
+):
+    table = messages_to_table(random_messages, message_type, config)
     casted_table = cast_table(table, message_type, config)
     assert table == casted_table
 
 
-@pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
-def test_cast_same_view(message_type: Type[Message], config: ProtarrowConfig):
-    source_messages = generate_messages(message_type, 10)
-    table = messages_to_table(source_messages, message_type, config)
+def test_cast_same_view(
+    message_type: Type[Message],
+    config: ProtarrowConfig,
+    random_messages: List[Message],
+):
+    table = messages_to_table(random_messages, message_type, config)
 
     view = table[5:]
     casted_view = cast_table(view, message_type, config)
@@ -468,15 +481,16 @@ def test_is_custom_field():
     )
 
 
-@pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("enum_value_type", [pa.string(), pa.binary()])
 def test_can_cast_enum_to_dictionary_and_back(
-    message_type: Type[Message], enum_value_type: pa.DataType
+    message_type: Type[Message],
+    enum_value_type: pa.DataType,
+    random_messages: List[Message],
 ):
     plain_config = ProtarrowConfig(enum_type=pa.string())
     dict_config = ProtarrowConfig(enum_type=pa.dictionary(pa.int32(), pa.string()))
 
-    source_messages = generate_messages(message_type, 10)
+    source_messages = random_messages
 
     plain_table = messages_to_table(source_messages, message_type, plain_config)
     dict_table = messages_to_table(source_messages, message_type, dict_config)
@@ -487,10 +501,13 @@ def test_can_cast_enum_to_dictionary_and_back(
     assert plain_table_back == plain_table
 
 
-@pytest.mark.parametrize("message_type", MESSAGES)
 @pytest.mark.parametrize("config", CONFIGS)
-def test_extractor(message_type: Type[Message], config: ProtarrowConfig):
-    source_messages = [m for m in generate_messages(message_type, 10)]
+def test_extractor(
+    message_type: Type[Message],
+    config: ProtarrowConfig,
+    random_messages: List[Message],
+):
+    source_messages = random_messages
 
     table = messages_to_table(source_messages, message_type, config)
     message_extractor = MessageExtractor(table.schema, message_type)
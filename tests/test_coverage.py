@@ -9,14 +9,11 @@ from typing import Optional
 import pyarrow as pa
 import pytest
 from google.protobuf.descriptor import Descriptor, EnumDescriptor, FieldDescriptor
-from google.protobuf.wrappers_pb2 import BoolValue, DoubleValue
+from google.protobuf.wrappers_pb2 import DoubleValue
 
 import protarrow
 from protarrow.arrow_to_proto import (
-    MapItemAssigner,
-    OffsetToSize,
     OptionalNestedIterable,
-    PlainAssigner,
     RepeatedNestedIterable,
     _extract_array_messages,
     _extract_map_field,
@@ -82,7 +79,7 @@ def test_optional_nested_iterable():
             None,
         ],
         NestedExampleMessage.DESCRIPTOR.fields_by_name["example_message"],
-        pa.array([True, True, False], pa.bool_()),
+        pa.array([True, True, False], pa.bool_()).to_numpy(zero_copy_only=False),
     )
 
     assert list(optional_nested_iterable) == [
@@ -92,44 +89,6 @@ def test_optional_nested_iterable():
     ]
 
 
-def test_map_item_assigner():
-    array = pa.array(
-        [[("hello", True), ("world", None)], None, tuple()],
-        pa.map_(pa.string(), pa.bool_()),
-    )
-
-    messages = [ExampleMessage(), ExampleMessage(), ExampleMessage()]
-    map_item_assigner = MapItemAssigner(
-        messages,
-        field_descriptor=ExampleMessage.DESCRIPTOR.fields_by_name[
-            "wrapped_bool_string_map"
-        ],
-        key_arrow_type=pa.string(),
-        value_arrow_type=pa.bool_(),
-        sizes=OffsetToSize(array.offsets),
-    )
-
-    for a, k, v in zip(map_item_assigner, array.keys, array.items):
-        a(k, v)
-    assert messages == [
-        ExampleMessage(
-            wrapped_bool_string_map={
-                "hello": BoolValue(value=True),
-                "world": BoolValue(value=False),
-            }
-        ),
-        ExampleMessage(),
-        ExampleMessage(),
-    ]
-
-
-def test_offset_to_size():
-    assert list(OffsetToSize(pa.array([0, 5, 10]))) == [5, 5]
-    assert list(OffsetToSize(pa.array([5, 10]))) == [5]
-    assert list(OffsetToSize(pa.array([], pa.int32()))) == []
-    assert list(OffsetToSize(pa.array([1]))) == []
-
-
 def test_get_enum_converter():
     enum_descriptor = ExampleMessage.DESCRIPTOR.fields_by_name[
         "example_enum_value"
@@ -215,40 +174,6 @@ def test_struct_scalar_converter():
     )
 
 
-def test_plain_assigner_not_nullable():
-    messages = [ExampleMessage(), ExampleMessage()]
-    plain_assigner = PlainAssigner(
-        messages=messages,
-        field_descriptor=ExampleMessage.DESCRIPTOR.fields_by_name["double_value"],
-        arrow_type=pa.float64(),
-    )
-    for a, v in zip(plain_assigner, pa.array([1.0, None], pa.float64())):
-        a(v)
-    assert messages == [ExampleMessage(double_value=1.0), ExampleMessage()]
-
-
-def test_plain_assigner_nullable():
-    messages = [
-        ExampleMessage(),
-        ExampleMessage(),
-        ExampleMessage(),
-    ]
-    plain_assigner = PlainAssigner(
-        messages=messages,
-        field_descriptor=ExampleMessage.DESCRIPTOR.fields_by_name[
-            "wrapped_double_value"
-        ],
-        arrow_type=pa.float64(),
-    )
-    for a, v in zip(plain_assigner, pa.array([1.0, 0.0, None], pa.float64())):
-        a(v)
-    assert messages == [
-        ExampleMessage(wrapped_double_value=DoubleValue(value=1.0)),
-        ExampleMessage(wrapped_double_value=DoubleValue(value=0.0)),
-        ExampleMessage(),
-    ]
-
-
 def test_missing_column():
     messages = [ExampleMessage(), ExampleMessage()]
     _extract_record_batch_messages(
@@ -373,7 +298,7 @@ def test_misaligned_nested_iterable():
     iterable = OptionalNestedIterable(
         [None, NestedExampleMessage(), None],
         NestedExampleMessage.DESCRIPTOR.fields_by_name["example_message"],
-        [pa.scalar(False), pa.scalar(False), pa.scalar(True)],
+        [False, False, True],
     )
     nested = list(iterable)
     assert nested == [None, None, None]
@@ -384,7 +309,7 @@ def test_misaligned_nested_iterable_prime():
     iterable = OptionalNestedIterable(
         [None, NestedExampleMessage(), None],
         NestedExampleMessage.DESCRIPTOR.fields_by_name["example_message"],
-        [pa.scalar(False), pa.scalar(False), pa.scalar(True)],
+        [False, False, True],
     )
     iterable.prime()
     nested = list(iterable)
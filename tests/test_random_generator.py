@@ -10,3 +10,10 @@ def test_with_optional():
 
     assert any(m.HasField("string_value") for m in messages)
     assert any(not m.HasField("string_value") for m in messages)
+
+
+def test_generate_messages_process_pool():
+    """The worker bootstrap must resolve the message type in a fresh process"""
+    messages = generate_messages(MessageWithOptional, 65, workers=2)
+    assert len(messages) == 65
+    assert all(isinstance(m, MessageWithOptional) for m in messages)